@@ -21,8 +21,9 @@ This API should be kept "remote service compatible" meaning inputs to
 routines should be primitive data types where possible.
 """
 import inspect
+from itertools import islice
 from types import ModuleType
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 import trio
 
@@ -32,30 +33,50 @@ from ..service import maybe_spawn_brokerd
 from .._cacheables import open_cached_client
 
 
+# api method lookup info keyed by ``(type(client), methname)``:
+# whether the method is found on the client's ``.api`` (instead of
+# the client itself) and the method's parameter names.
+_api_meths: Dict[Tuple[type, str], Tuple[bool, Tuple[str, ...]]] = {}
+
+
 async def api(brokername: str, methname: str, **kwargs) -> dict:
     """Make (proxy through) a broker API call by name and return its result.
     """
     brokermod = get_brokermod(brokername)
     async with brokermod.get_client() as client:
-        meth = getattr(client, methname, None)
-        if meth is None:
-            log.debug(
-                f"Couldn't find API method {methname} looking up on client")
-            meth = getattr(client.api, methname, None)
-
-        if meth is None:
-            log.error(f"No api method `{methname}` could be found?")
-            return
+        key = (type(client), methname)
+        info = _api_meths.get(key)
+        if info is not None:
+            on_api, params = info
+            meth = getattr(client.api if on_api else client, methname)
 
-        if not kwargs:
-            # verify kwargs requirements are met
-            sig = inspect.signature(meth)
-            if sig.parameters:
-                log.error(
-                    f"Argument(s) are required by the `{methname}` method: "
-                    f"{tuple(sig.parameters.keys())}")
+        else:
+            # first lookup; signature introspection is slow so only
+            # resolve the method's owner and params once.
+            on_api = False
+            meth = getattr(client, methname, None)
+            if meth is None:
+                on_api = True
+                meth = getattr(
+                    getattr(client, 'api', None),
+                    methname,
+                    None,
+                )
+
+            if meth is None:
+                log.error(f"No api method `{methname}` could be found?")
                 return
 
+            params = tuple(inspect.signature(meth).parameters)
+            _api_meths[key] = on_api, params
+
+        # verify kwargs requirements are met
+        if not kwargs and params:
+            log.error(
+                f"Argument(s) are required by the `{methname}` method: "
+                f"{params}")
+            return
+
         return await meth(**kwargs)
 
 
@@ -64,9 +85,43 @@ async def stocks_quote(
     tickers: List[str]
 ) -> Dict[str, Dict[str, Any]]:
     """Return quotes dict for ``tickers``.
+
+    If the backend client declares a ``max_batch`` (the max number of
+    symbols allowed per quote request) the ``tickers`` are chunked into
+    batches of that size and dispatched concurrently in waves of at
+    most the client's ``rate_limit`` (``.quote()`` calls/sec). Quotes
+    are always returned in ``tickers`` order.
     """
     async with brokermod.get_client() as client:
-        return await client.quote(tickers)
+        max_batch = getattr(client, 'max_batch', None)
+        if not max_batch or len(tickers) <= max_batch:
+            return await client.quote(tickers)
+
+        syms = iter(tickers)
+        chunks = []
+        while chunk := list(islice(syms, max_batch)):
+            chunks.append(chunk)
+
+        # per-chunk result slots so output order matches input order
+        # regardless of request completion order.
+        results: List[List[dict]] = [[] for _ in chunks]
+
+        async def fetch_chunk(i: int) -> None:
+            results[i] = await client.quote(chunks[i])
+
+        rate = getattr(client, 'rate_limit', 1)
+        for wave in range(0, len(chunks), rate):
+            start = trio.current_time()
+            async with trio.open_nursery() as n:
+                for i in range(wave, min(wave + rate, len(chunks))):
+                    n.start_soon(fetch_chunk, i)
+
+            # only wait out the rest of the second if more chunks
+            # are still queued.
+            if wave + rate < len(chunks):
+                await trio.sleep_until(start + 1)
+
+        return [quote for chunk in results for quote in chunk]
 
 
 # TODO: these need tests
@@ -35,11 +35,11 @@ from typing import (
     Sequence
 )
 import contextlib
+from contextlib import asynccontextmanager
 
 import trio
 import tractor
 from tractor.experimental import msgpub
-from async_generator import asynccontextmanager
 
 from ._util import (
     log,
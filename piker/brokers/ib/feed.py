@@ -20,6 +20,7 @@ Data feed endpoints pre-wrapped and ready for use with ``tractor``/``trio``.
 from __future__ import annotations
 import asyncio
 from contextlib import (
+    aclosing,
     asynccontextmanager as acm,
     nullcontext,
 )
@@ -35,7 +36,6 @@ from typing import (
     Awaitable,
 )
 
-from async_generator import aclosing
 from fuzzywuzzy import process as fuzzy
 import numpy as np
 import pendulum
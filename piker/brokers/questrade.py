@@ -18,12 +18,17 @@
 Questrade API backend.
 """
 from __future__ import annotations
+from contextlib import asynccontextmanager
 import inspect
 import time
 from datetime import datetime
 from functools import partial
 import itertools
 import configparser
+import json
+import os
+from pathlib import Path
+import tempfile
 from pprint import pformat
 from typing import (
     List, Tuple, Dict, Any, Iterator, NamedTuple,
@@ -34,7 +39,6 @@ from typing import (
 import pendulum
 import trio
 import tractor
-from async_generator import asynccontextmanager
 import numpy as np
 import wrapt
 import asks
@@ -59,6 +63,10 @@ _version = 'v1'
 # it seems 4 rps is best we can do total
 _rate_limit = 4
 
+# re-lookup persisted ticker ids after this many seconds (symbols can
+# be delisted/re-used)
+_ticker_ids_ttl = 90 * 24 * 60 * 60
+
 _time_frames = {
     '1m': 'OneMinute',
     '2m': 'TwoMinutes',
@@ -79,6 +87,60 @@ _time_frames = {
 }
 
 
+def _ticker_ids_path() -> Path:
+    return Path(config._config_dir) / 'questrade' / 'ticker_ids.json'
+
+
+def load_ticker_ids() -> Dict[str, Tuple[str, float]]:
+    """Load the (persisted) ticker symbol to ``(QT numeric id, lookup
+    time)`` map.
+
+    Entries older then ``_ticker_ids_ttl`` are dropped so they'll be
+    re-requested on next use.
+    """
+    path = _ticker_ids_path()
+    try:
+        with path.open() as f:
+            ids = json.load(f)
+        expired = time.time() - _ticker_ids_ttl
+        return {
+            sym: (str(id), float(ts))
+            for sym, (id, ts) in ids.items()
+            if ts > expired
+        }
+    except FileNotFoundError:
+        return {}
+    except (ValueError, TypeError, AttributeError):
+        log.warning(f"Ignoring corrupt ticker id cache {path}")
+        return {}
+
+
+def write_ticker_ids(ids: Dict[str, Tuple[str, float]]) -> None:
+    """Persist the ticker symbol to ``(QT numeric id, lookup time)`` map
+    to disk.
+
+    The file is written to a temp file and atomically swapped into place
+    so concurrent writers (eg. a ``brokerd`` and a cli cmd) can never
+    leave a truncated file.
+    """
+    path = _ticker_ids_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        'w',
+        dir=path.parent,
+        prefix=f'.{path.name}.',
+        delete=False,
+    ) as f:
+        try:
+            json.dump(ids, f, separators=(',', ':'))
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+
+    os.replace(f.name, path)
+
+
 class QuestradeError(Exception):
     "Non-200 OK response code"
 
@@ -266,6 +328,13 @@ class Client:
 
     Provides a high-level api which wraps the underlying endpoint calls.
     """
+    # max number of symbol ids allowed per quote request
+    max_batch: int = 100
+    # max ``.quote()`` calls per second; NOTE: each call may make
+    # 2 requests (a symbol id lookup then the quotes) so use half
+    # the total api request limit.
+    rate_limit: int = _rate_limit // 2
+
     def __init__(
         self,
         config: dict,
@@ -283,7 +352,10 @@ class Client:
             'practice' if self._is_practice else '')
         self.access_data = {}
         self._reload_config(config=config)
-        self._symbol_cache: Dict[str, int] = {}
+        self._symbol_cache: Dict[
+            str,
+            Tuple[str, float],
+        ] = load_ticker_ids()
         self._optids2contractinfo = {}
         self._contract2ids = {}
         # for blocking during token refresh
@@ -409,19 +481,24 @@ class Client:
 
     async def tickers2ids(
         self,
-        tickers: Iterator[str]
+        tickers: Iterator[str],
+        refresh: bool = False,
     ) -> Dict[str, int]:
         """Helper routine that take a sequence of ticker symbols and returns
         their corresponding QT numeric symbol ids.
 
-        Cache any symbol to id lookups for later use.
+        Cache any symbol to id lookups for later use (both in memory and
+        on disk) for up to ``_ticker_ids_ttl`` seconds. Pass
+        ``refresh=True`` to re-request (and overwrite) cached ids.
         """
         cache = self._symbol_cache
         symbols2ids = {}
-        for symbol in tickers:
-            id = cache.get(symbol)
-            if id is not None:
-                symbols2ids[symbol] = id
+        now = time.time()
+        if not refresh:
+            for symbol in tickers:
+                id, ts = cache.get(symbol, (None, 0))
+                if id is not None and now - ts < _ticker_ids_ttl:
+                    symbols2ids[symbol] = id
 
         # still missing uncached values - hit the api server
         to_lookup = list(set(tickers) - set(symbols2ids))
@@ -429,7 +506,10 @@ class Client:
             data = await self.api.symbols(names=','.join(to_lookup))
             for symbol in data['symbols']:
                 name = symbol['symbol']
-                cache[name] = symbols2ids[name] = str(symbol['symbolId'])
+                symbols2ids[name] = str(symbol['symbolId'])
+                cache[name] = (symbols2ids[name], now)
+
+            write_ticker_ids(cache)
 
         return symbols2ids
 
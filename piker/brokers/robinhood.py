@@ -23,8 +23,8 @@ account to test this code.
 """
 from functools import partial
 from typing import List
+from contextlib import asynccontextmanager
 
-from async_generator import asynccontextmanager
 import asks
 
 from ._util import (
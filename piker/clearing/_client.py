@@ -19,10 +19,19 @@ Orders and execution client API.
 
 """
 from __future__ import annotations
-from contextlib import asynccontextmanager as acm
+from collections import OrderedDict
+from contextlib import (
+    asynccontextmanager as acm,
+    contextmanager as cm,
+)
+import logging
 from pprint import pformat
-from typing import TYPE_CHECKING
+from typing import (
+    Iterator,
+    TYPE_CHECKING,
+)
 
+from msgspec import field
 import trio
 import tractor
 from tractor.trionics import broadcast_receiver
@@ -35,6 +44,7 @@ from ..service import maybe_open_emsd
 from ._messages import (
     Order,
     Cancel,
+    Batch,
     BrokerdPosition,
 )
 from ..brokers import get_brokermod
@@ -44,6 +54,10 @@ if TYPE_CHECKING:
         Status,
     )
 
+# max number of order msgs kept in a client's history table before
+# the least recently sent/updated are evicted.
+_max_sent_orders: int = 10_000
+
 
 class OrderClient(Struct):
     '''
@@ -60,8 +74,156 @@ class OrderClient(Struct):
     _to_relay_task: trio.abc.SendChannel
     _from_sync_order_client: trio.abc.ReceiveChannel
 
-    # history table
-    _sent_orders: dict[str, Order] = {}
+    # history table (in LRU order), always allocated per-instance;
+    # values are the (slotted, fixed schema) ``Order`` msg structs
+    # exactly as sent, no per-entry dicts are kept.
+    _sent_orders: OrderedDict[str, Order] = field(
+        default_factory=OrderedDict,
+    )
+
+    # sync cmds deferred for relay as a single ``Batch`` msg,
+    # only set while inside a ``.batched()`` block.
+    _pending: list[Order | Cancel] | None = None
+
+    # set while the relay buffer is above the backpressure threshold
+    _backlog_warned: bool = False
+
+    def iter_orders(
+        self,
+        fqme: str | None = None,
+
+    ) -> Iterator[Order]:
+        '''
+        Iterate the tracked (sent) order msgs, optionally filtered
+        to a single ``fqme``.
+
+        Msgs are delivered as-is (no copies or dict conversion) so
+        scans like exposure calcs are cheap; don't mutate them, use
+        ``.update()`` instead.
+
+        '''
+        for order in self._sent_orders.values():
+            if (
+                fqme is None
+                or order.symbol == fqme
+            ):
+                yield order
+
+    def relay_backlog(self) -> int:
+        '''
+        Return the number of sync-submitted msgs still queued for
+        relay to the `emsd`; a gauge for detecting backpressure.
+
+        '''
+        return self._to_relay_task.statistics().current_buffer_used
+
+    def _push_nowait(
+        self,
+        msg: Order | Cancel | Batch,
+    ) -> None:
+        stats = self._to_relay_task.statistics()
+        full: bool = (
+            stats.current_buffer_used >= 0.8 * stats.max_buffer_size
+        )
+        # only warn when first crossing the threshold, not on every
+        # submit during the burst which (likely) filled the buffer.
+        if full and not self._backlog_warned:
+            log.warning(
+                'Order relay buffer is >80% full!\n'
+                f'{stats.current_buffer_used}/{stats.max_buffer_size} '
+                'msgs are queued, submissions will soon fail..'
+            )
+        self._backlog_warned = full
+        self._to_relay_task.send_nowait(msg)
+
+    def _track(
+        self,
+        msg: Order,
+    ) -> None:
+        orders = self._sent_orders
+        orders[msg.oid] = msg
+        orders.move_to_end(msg.oid)
+        if len(orders) > _max_sent_orders:
+            oid, order = orders.popitem(last=False)
+            log.warning(
+                f'Evicted order {oid} from local tracking!\n'
+                f'More then {_max_sent_orders} orders are being tracked, '
+                'if this order is still live it will show as unknown:\n'
+                f'{order.pformat()}'
+            )
+
+    def _relay_nowait(
+        self,
+        msg: Order | Cancel,
+    ) -> None:
+        if self._pending is not None:
+            self._pending.append(msg)
+        else:
+            self._push_nowait(msg)
+
+    @cm
+    def batched(self) -> Iterator[list[Order | Cancel]]:
+        '''
+        Defer relay of all sync (``.*_nowait()``) cmds submitted
+        inside this block and deliver them to the `emsd` in a single
+        ``Batch`` msg on exit.
+
+        If the block errors the (partially built) batch is dropped and
+        *nothing* is sent, though any orders submitted inside it are
+        still recorded in the local history table.
+
+        '''
+        if self._pending is not None:
+            # nested use, outer-most block does the flush
+            yield self._pending
+            return
+
+        self._pending = pending = []
+        try:
+            yield pending
+        finally:
+            self._pending = None
+
+        # only reached on normal (non-error) exit
+        if pending:
+            self.send_batch_nowait(pending)
+
+    def _mk_batch(
+        self,
+        msgs: list[Order | Cancel],
+    ) -> Batch:
+        for msg in msgs:
+            if isinstance(msg, Order):
+                self._track(msg)
+
+        return Batch(cmds=[msg.to_dict() for msg in msgs])
+
+    def send_batch_nowait(
+        self,
+        msgs: list[Order | Cancel],
+
+    ) -> Batch:
+        '''
+        Sync version of ``.send_batch()``.
+
+        '''
+        batch = self._mk_batch(msgs)
+        self._push_nowait(batch)
+        return batch
+
+    async def send_batch(
+        self,
+        msgs: list[Order | Cancel],
+
+    ) -> Batch:
+        '''
+        Send many order/cancel msgs to the `emsd` service in a single
+        ``Batch`` msg; see its docs for (non-atomic) processing semantics.
+
+        '''
+        batch = self._mk_batch(msgs)
+        await self._ems_stream.send(batch)
+        return batch
 
     def send_nowait(
         self,
@@ -72,8 +234,8 @@ class OrderClient(Struct):
         Sync version of ``.send()``.
 
         '''
-        self._sent_orders[msg.oid] = msg
-        self._to_relay_task.send_nowait(msg)
+        self._track(msg)
+        self._relay_nowait(msg)
         return msg
 
     async def send(
@@ -85,7 +247,7 @@ class OrderClient(Struct):
         Send a new order msg async to the `emsd` service.
 
         '''
-        self._sent_orders[msg.oid] = msg
+        self._track(msg)
         await self._ems_stream.send(msg)
         return msg
 
@@ -101,8 +263,8 @@ class OrderClient(Struct):
         '''
         cmd = self._sent_orders[uuid]
         msg = cmd.copy(update=data)
-        self._sent_orders[uuid] = msg
-        self._to_relay_task.send_nowait(msg)
+        self._track(msg)
+        self._relay_nowait(msg)
         return msg
 
     async def update(
@@ -117,21 +279,23 @@ class OrderClient(Struct):
         '''
         cmd = self._sent_orders[uuid]
         msg = cmd.copy(update=data)
-        self._sent_orders[uuid] = msg
+        self._track(msg)
         await self._ems_stream.send(msg)
         return msg
 
     def _mk_cancel_msg(
         self,
         uuid: str,
-    ) -> Cancel:
+    ) -> Cancel | None:
         cmd = self._sent_orders.get(uuid)
         if not cmd:
             log.error(
                 f'Unknown order {uuid}!?\n'
-                f'Maybe there is a stale entry or line?\n'
+                f'Maybe there is a stale (or evicted) entry or line?\n'
                 f'You should report this as a bug!'
             )
+            return None
+
         fqme = str(cmd.symbol)
         return Cancel(
             oid=uuid,
@@ -147,9 +311,9 @@ class OrderClient(Struct):
         Sync version of ``.cancel()``.
 
         '''
-        self._to_relay_task.send_nowait(
-            self._mk_cancel_msg(uuid)
-        )
+        msg = self._mk_cancel_msg(uuid)
+        if msg is not None:
+            self._relay_nowait(msg)
 
     async def cancel(
         self,
@@ -159,10 +323,16 @@ class OrderClient(Struct):
         '''
         Cancel an already existintg order (or alert) dialog.
 
+        Return ``False`` if the order is unknown (and thus no cancel
+        request could be sent).
+
         '''
-        await self._ems_stream.send(
-            self._mk_cancel_msg(uuid)
-        )
+        msg = self._mk_cancel_msg(uuid)
+        if msg is None:
+            return False
+
+        await self._ems_stream.send(msg)
+        return True
 
 
 
@@ -193,18 +363,36 @@ async def relay_orders_from_sync_code(
         client._from_sync_order_client.subscribe() as sync_order_cmds
     ):
         async for cmd in sync_order_cmds:
-            sym = cmd.symbol
-            msg = pformat(cmd.to_dict())
+            if isinstance(cmd, Batch):
+                cmds = [
+                    c for c in cmd.cmds
+                    if c['symbol'] == symbol_key
+                ]
+                if len(cmds) < len(cmd.cmds):
+                    log.warning(
+                        f'Ignoring {len(cmd.cmds) - len(cmds)} unmatched '
+                        f'batched order cmds for != {symbol_key}'
+                    )
+                if cmds:
+                    log.info(f'Send batch of {len(cmds)} order cmds')
+                    await to_ems_stream.send(Batch(cmds=cmds))
+                continue
 
+            sym = cmd.symbol
             if sym == symbol_key:
-                log.info(f'Send order cmd:\n{msg}')
+                # NOTE: only render the msg if it'll actually be
+                # logged; the struct itself is encoded exactly once
+                # by the ``tractor`` (msgspec) codec on send.
+                if log.isEnabledFor(logging.INFO):
+                    log.info(f'Send order cmd:\n{pformat(cmd.to_dict())}')
+
                 # send msg over IPC / wire
                 await to_ems_stream.send(cmd)
 
             else:
                 log.warning(
                     f'Ignoring unmatched order cmd for {sym} != {symbol_key}:'
-                    f'\n{msg}'
+                    f'\n{pformat(cmd.to_dict())}'
                 )
 
 
@@ -214,6 +402,10 @@ async def open_ems(
     mode: str = 'live',
     loglevel: str = 'error',
 
+    # max number of sync-submitted order msgs which can be queued
+    # for relay to the `emsd` before ``.*_nowait()`` calls error.
+    relay_buffer_size: int = 1024,
+
 ) -> tuple[
     OrderClient,
     tractor.MsgStream,
@@ -234,6 +426,10 @@ async def open_ems(
     if it can't be discovered and generally speaking is the lowest level
     broker control client-API.
 
+    The `emsd` is a single (``pikerd`` managed) service per actor tree;
+    every call (eg. one per chart) reuses it and only opens a new order
+    dialog context for its ``fqme``.
+
     '''
     # TODO: prolly hand in the `MktPair` instance directly here as well!
     from piker.accounting import unpack_fqme
@@ -253,7 +449,10 @@ async def open_ems(
 
         from ._ems import _emsd_main
         async with (
-            # connect to emsd
+            # connect to emsd; NOTE: the ``ctx.started()`` msg which
+            # delivers the initial (positions, accounts, dialogs) state
+            # *is* the readiness handshake, no extra sync is needed
+            # before submitting cmds on the stream.
             portal.open_context(
                 _emsd_main,
                 fqme=fqme,
@@ -272,9 +471,8 @@ async def open_ems(
             # open 2-way trade command stream
             ctx.open_stream() as trades_stream,
         ):
-            size: int = 100  # what should this be?
-            tx, rx = trio.open_memory_channel(size)
-            brx = broadcast_receiver(rx, size)
+            tx, rx = trio.open_memory_channel(relay_buffer_size)
+            brx = broadcast_receiver(rx, relay_buffer_size)
 
             # setup local ui event streaming channels for request/resp
             # streamging with EMS daemon
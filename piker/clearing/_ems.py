@@ -23,7 +23,11 @@ from collections import (
     defaultdict,
     # ChainMap,
 )
-from contextlib import asynccontextmanager as acm
+from contextlib import (
+    asynccontextmanager as acm,
+    aclosing,
+)
+import logging
 from math import isnan
 from pprint import pformat
 import time
@@ -1047,6 +1051,24 @@ async def translate_and_relay_brokerd_events(
         #     del status_msg
 
 
+async def iter_client_cmds(
+    client_order_stream: tractor.MsgStream,
+
+) -> AsyncIterator[dict]:
+    '''
+    Iterate client order cmds, unpacking any ``Batch`` msgs into their
+    individual cmds (in order).
+
+    '''
+    async for msg in client_order_stream:
+        match msg:
+            case {'action': 'batch', 'cmds': cmds}:
+                for cmd in cmds:
+                    yield cmd
+            case _:
+                yield msg
+
+
 async def process_client_order_cmds(
 
     client_order_stream: tractor.MsgStream,
@@ -1068,284 +1090,292 @@ async def process_client_order_cmds(
 
     '''
     # cmd: dict
-    async for cmd in client_order_stream:
-        log.info(f'Received order cmd:\n{pformat(cmd)}')
-
-        # CAWT DAMN we need struct support!
-        oid = str(cmd['oid'])
+    async with aclosing(
+        iter_client_cmds(client_order_stream)
+    ) as cmds:
+        async for cmd in cmds:
+            # NOTE: avoid rendering every cmd when the log level is off
+            if log.isEnabledFor(logging.INFO):
+                log.info(f'Received order cmd:\n{pformat(cmd)}')
+
+            # CAWT DAMN we need struct support!
+            oid = str(cmd['oid'])
+
+            # register this stream as an active order dialog (msg flow) for
+            # this order id such that translated message from the brokerd
+            # backend can be routed and relayed to subscribed clients.
+            subs = router.dialogs[oid]
+
+            # add all subscribed clients for this fqme (should eventually be
+            # a more generalize subscription system) to received order msg
+            # updates (and thus show stuff in the UI).
+            subs.add(client_order_stream)
+            subs.update(router.subscribers[fqme])
+
+            reqid = dark_book._ems2brokerd_ids.inverse.get(oid)
+
+            # any dark/live status which is current
+            status = dark_book._active.get(oid)
+
+            match cmd:
+                # existing LIVE CANCEL
+                case {
+                    'action': 'cancel',
+                    'oid': oid,
+                } if (
+                    status
+                    and status.resp in (
+                        'open',
+                        'pending',
+                    )
+                ):
+                    reqid = status.reqid
+                    order = status.req
+
+                    # XXX: cancelled-before-ack race case.
+                    # This might be a cancel for an order that hasn't been
+                    # acked yet by a brokerd (so it's in the midst of being
+                    # ``BrokerdAck``ed for submission but we don't have that
+                    # confirmation response back yet). Set this client-side
+                    # msg state so when the ack does show up (later)
+                    # logic in ``translate_and_relay_brokerd_events()`` can
+                    # forward the cancel request to the `brokerd` side of
+                    # the order flow ASAP.
+                    status.cancel_called = True
+
+                    # NOTE: cancel response will be relayed back in messages
+                    # from corresponding broker
+                    if reqid is not None:
+                        # send cancel to brokerd immediately!
+                        log.info(
+                            f'Submitting cancel for live order {reqid}'
+                        )
+                        await brokerd_order_stream.send(
+                            BrokerdCancel(
+                                oid=oid,
+                                reqid=reqid,
+                                time_ns=time.time_ns(),
+                                account=order.account,
+                            )
+                        )
 
-        # register this stream as an active order dialog (msg flow) for
-        # this order id such that translated message from the brokerd
-        # backend can be routed and relayed to subscribed clients.
-        subs = router.dialogs[oid]
+                # DARK trigger CANCEL
+                case {
+                    'action': 'cancel',
+                    'oid': oid,
+                } if (
+                    status
+                    and status.resp == 'dark_open'
+                ):
+                    # remove from dark book clearing
+                    entry = dark_book.triggers[fqme].pop(oid, None)
+                    if entry:
+                        (
+                            pred,
+                            tickfilter,
+                            cmd,
+                            percent_away,
+                            abs_diff_away
+                        ) = entry
+
+                        # tell client side that we've cancelled the
+                        # dark-trigger order
+                        status.resp = 'canceled'
+                        status.req = cmd
+
+                        await router.client_broadcast(
+                            fqme,
+                            status,
+                        )
 
-        # add all subscribed clients for this fqme (should eventually be
-        # a more generalize subscription system) to received order msg
-        # updates (and thus show stuff in the UI).
-        subs.add(client_order_stream)
-        subs.update(router.subscribers[fqme])
+                        # de-register this order dialogue from all clients
+                        router.dialogs[oid].clear()
+                        router.dialogs.pop(oid)
+                        dark_book._active.pop(oid)
 
-        reqid = dark_book._ems2brokerd_ids.inverse.get(oid)
+                    else:
+                        log.exception(f'No dark order for {fqme}?')
+
+                # TODO: eventually we should be receiving
+                # this struct on the wire unpacked in a scoped protocol
+                # setup with ``tractor`` using ``msgspec``.
+
+                # LIVE order REQUEST
+                case {
+                    'oid': oid,
+                    'symbol': fqme,
+                    'price': trigger_price,
+                    'size': size,
+                    'action': ('buy' | 'sell') as action,
+                    'exec_mode': ('live' | 'paper'),
+                }:
+                    # TODO: relay this order msg directly?
+                    req = Order(**cmd)
+                    broker = req.brokers[0]
+
+                    # remove the broker part before creating a message
+                    # to send to the specific broker since they probably
+                    # aren't expectig their own name, but should they?
+                    sym = fqme.replace(f'.{broker}', '')
+
+                    if status is not None:
+                        # if we already had a broker order id then
+                        # this is likely an order update commmand.
+                        reqid = status.reqid
+                        log.info(f"Modifying live {broker} order: {reqid}")
+                        status.req = req
+                        status.resp = 'pending'
+
+                    msg = BrokerdOrder(
+                        oid=oid,  # no ib support for oids...
+                        time_ns=time.time_ns(),
 
-        # any dark/live status which is current
-        status = dark_book._active.get(oid)
+                        # if this is None, creates a new order
+                        # otherwise will modify any existing one
+                        reqid=reqid,
 
-        match cmd:
-            # existing LIVE CANCEL
-            case {
-                'action': 'cancel',
-                'oid': oid,
-            } if (
-                status
-                and status.resp in (
-                    'open',
-                    'pending',
-                )
-            ):
-                reqid = status.reqid
-                order = status.req
-
-                # XXX: cancelled-before-ack race case.
-                # This might be a cancel for an order that hasn't been
-                # acked yet by a brokerd (so it's in the midst of being
-                # ``BrokerdAck``ed for submission but we don't have that
-                # confirmation response back yet). Set this client-side
-                # msg state so when the ack does show up (later)
-                # logic in ``translate_and_relay_brokerd_events()`` can
-                # forward the cancel request to the `brokerd` side of
-                # the order flow ASAP.
-                status.cancel_called = True
-
-                # NOTE: cancel response will be relayed back in messages
-                # from corresponding broker
-                if reqid is not None:
-                    # send cancel to brokerd immediately!
-                    log.info(
-                        f'Submitting cancel for live order {reqid}'
+                        symbol=sym,
+                        action=action,
+                        price=trigger_price,
+                        size=size,
+                        account=req.account,
                     )
-                    await brokerd_order_stream.send(
-                        BrokerdCancel(
+
+                    if status is None:
+                        status = Status(
                             oid=oid,
                             reqid=reqid,
+                            resp='pending',
                             time_ns=time.time_ns(),
-                            account=order.account,
+                            brokerd_msg=msg,
+                            req=req,
                         )
-                    )
 
-            # DARK trigger CANCEL
-            case {
-                'action': 'cancel',
-                'oid': oid,
-            } if (
-                status
-                and status.resp == 'dark_open'
-            ):
-                # remove from dark book clearing
-                entry = dark_book.triggers[fqme].pop(oid, None)
-                if entry:
-                    (
+                    dark_book._active[oid] = status
+
+                    # send request to backend
+                    # XXX: the trades data broker response loop
+                    # (``translate_and_relay_brokerd_events()`` above) will
+                    # handle relaying the ems side responses back to
+                    # the client/cmd sender from this request
+                    if log.isEnabledFor(logging.INFO):
+                        log.info(
+                            f'Sending live order to {broker}:\n{pformat(msg)}'
+                        )
+                    await brokerd_order_stream.send(msg)
+
+                    # an immediate response should be ``BrokerdOrderAck``
+                    # with ems order id from the ``trades_dialogue()``
+                    # endpoint, but we register our request as part of the
+                    # flow so that if a cancel comes from the requesting
+                    # client, before that ack, when the ack does arrive we
+                    # immediately take the reqid from the broker and cancel
+                    # that live order asap.
+                    # dark_book._msgflows[oid].maps.insert(0, msg.to_dict())
+
+                # DARK-order / alert REQUEST
+                case {
+                    'oid': oid,
+                    'symbol': fqme,
+                    'price': trigger_price,
+                    'size': size,
+                    'exec_mode': exec_mode,
+                    'action': action,
+                    'brokers': _,  # list
+                } if (
+                        # "DARK" triggers
+                        # submit order to local EMS book and scan loop,
+                        # effectively a local clearing engine, which
+                        # scans for conditions and triggers matching executions
+                        exec_mode in ('dark',)
+                        or action == 'alert'
+                ):
+                    req = Order(**cmd)
+
+                    # Auto-gen scanner predicate:
+                    # we automatically figure out what the alert check
+                    # condition should be based on the current first
+                    # price received from the feed, instead of being
+                    # like every other shitty tina platform that makes
+                    # the user choose the predicate operator.
+                    last = dark_book.lasts[fqme]
+
+                    # sometimes the real-time feed hasn't come up
+                    # so just pull from the latest history.
+                    if isnan(last):
+                        last = flume.rt_shm.array[-1]['close']
+
+                    pred = mk_check(trigger_price, last, action)
+
+                    # NOTE: for dark orders currently we submit
+                    # the triggered live order at a price 5 ticks
+                    # above/below the L1 prices.
+                    # TODO: make this configurable from our top level
+                    # config, prolly in a .clearing` section?
+                    spread_slap: float = 5
+                    min_tick = float(flume.mkt.size_tick)
+                    min_tick_digits = float_digits(min_tick)
+
+                    if action == 'buy':
+                        tickfilter = ('ask', 'last', 'trade')
+                        percent_away = 0.005
+
+                        # TODO: we probably need to scale this based
+                        # on some near term historical spread
+                        # measure?
+                        abs_diff_away = round(
+                            spread_slap * min_tick,
+                            ndigits=min_tick_digits,
+                        )
+
+                    elif action == 'sell':
+                        tickfilter = ('bid', 'last', 'trade')
+                        percent_away = -0.005
+                        abs_diff_away = round(
+                            -spread_slap * min_tick,
+                            ndigits=min_tick_digits,
+                        )
+
+                    else:  # alert
+                        tickfilter = ('trade', 'utrade', 'last')
+                        percent_away = 0
+                        abs_diff_away = 0
+
+                    # submit execution/order to EMS scan loop
+                    # NOTE: this may result in an override of an existing
+                    # dark book entry if the order id already exists
+                    dark_book.triggers.setdefault(
+                        fqme, {}
+                    )[oid] = (
                         pred,
                         tickfilter,
-                        cmd,
+                        req,
                         percent_away,
                         abs_diff_away
-                    ) = entry
-
-                    # tell client side that we've cancelled the
-                    # dark-trigger order
-                    status.resp = 'canceled'
-                    status.req = cmd
-
-                    await router.client_broadcast(
-                        fqme,
-                        status,
                     )
+                    resp = 'dark_open'
 
-                    # de-register this order dialogue from all clients
-                    router.dialogs[oid].clear()
-                    router.dialogs.pop(oid)
-                    dark_book._active.pop(oid)
+                    # alerts have special msgs to distinguish
+                    # if action == 'alert':
+                    #     resp = 'open'
 
-                else:
-                    log.exception(f'No dark order for {fqme}?')
-
-            # TODO: eventually we should be receiving
-            # this struct on the wire unpacked in a scoped protocol
-            # setup with ``tractor`` using ``msgspec``.
-
-            # LIVE order REQUEST
-            case {
-                'oid': oid,
-                'symbol': fqme,
-                'price': trigger_price,
-                'size': size,
-                'action': ('buy' | 'sell') as action,
-                'exec_mode': ('live' | 'paper'),
-            }:
-                # TODO: relay this order msg directly?
-                req = Order(**cmd)
-                broker = req.brokers[0]
-
-                # remove the broker part before creating a message
-                # to send to the specific broker since they probably
-                # aren't expectig their own name, but should they?
-                sym = fqme.replace(f'.{broker}', '')
-
-                if status is not None:
-                    # if we already had a broker order id then
-                    # this is likely an order update commmand.
-                    reqid = status.reqid
-                    log.info(f"Modifying live {broker} order: {reqid}")
-                    status.req = req
-                    status.resp = 'pending'
-
-                msg = BrokerdOrder(
-                    oid=oid,  # no ib support for oids...
-                    time_ns=time.time_ns(),
-
-                    # if this is None, creates a new order
-                    # otherwise will modify any existing one
-                    reqid=reqid,
-
-                    symbol=sym,
-                    action=action,
-                    price=trigger_price,
-                    size=size,
-                    account=req.account,
-                )
-
-                if status is None:
                     status = Status(
+                        resp=resp,
                         oid=oid,
-                        reqid=reqid,
-                        resp='pending',
                         time_ns=time.time_ns(),
-                        brokerd_msg=msg,
                         req=req,
+                        src='dark',
                     )
+                    dark_book._active[oid] = status
 
-                dark_book._active[oid] = status
-
-                # send request to backend
-                # XXX: the trades data broker response loop
-                # (``translate_and_relay_brokerd_events()`` above) will
-                # handle relaying the ems side responses back to
-                # the client/cmd sender from this request
-                log.info(f'Sending live order to {broker}:\n{pformat(msg)}')
-                await brokerd_order_stream.send(msg)
-
-                # an immediate response should be ``BrokerdOrderAck``
-                # with ems order id from the ``trades_dialogue()``
-                # endpoint, but we register our request as part of the
-                # flow so that if a cancel comes from the requesting
-                # client, before that ack, when the ack does arrive we
-                # immediately take the reqid from the broker and cancel
-                # that live order asap.
-                # dark_book._msgflows[oid].maps.insert(0, msg.to_dict())
-
-            # DARK-order / alert REQUEST
-            case {
-                'oid': oid,
-                'symbol': fqme,
-                'price': trigger_price,
-                'size': size,
-                'exec_mode': exec_mode,
-                'action': action,
-                'brokers': _,  # list
-            } if (
-                    # "DARK" triggers
-                    # submit order to local EMS book and scan loop,
-                    # effectively a local clearing engine, which
-                    # scans for conditions and triggers matching executions
-                    exec_mode in ('dark',)
-                    or action == 'alert'
-            ):
-                req = Order(**cmd)
-
-                # Auto-gen scanner predicate:
-                # we automatically figure out what the alert check
-                # condition should be based on the current first
-                # price received from the feed, instead of being
-                # like every other shitty tina platform that makes
-                # the user choose the predicate operator.
-                last = dark_book.lasts[fqme]
-
-                # sometimes the real-time feed hasn't come up
-                # so just pull from the latest history.
-                if isnan(last):
-                    last = flume.rt_shm.array[-1]['close']
-
-                pred = mk_check(trigger_price, last, action)
-
-                # NOTE: for dark orders currently we submit
-                # the triggered live order at a price 5 ticks
-                # above/below the L1 prices.
-                # TODO: make this configurable from our top level
-                # config, prolly in a .clearing` section?
-                spread_slap: float = 5
-                min_tick = float(flume.mkt.size_tick)
-                min_tick_digits = float_digits(min_tick)
-
-                if action == 'buy':
-                    tickfilter = ('ask', 'last', 'trade')
-                    percent_away = 0.005
-
-                    # TODO: we probably need to scale this based
-                    # on some near term historical spread
-                    # measure?
-                    abs_diff_away = round(
-                        spread_slap * min_tick,
-                        ndigits=min_tick_digits,
-                    )
-
-                elif action == 'sell':
-                    tickfilter = ('bid', 'last', 'trade')
-                    percent_away = -0.005
-                    abs_diff_away = round(
-                        -spread_slap * min_tick,
-                        ndigits=min_tick_digits,
+                    # broadcast status to all subscribed clients
+                    await router.client_broadcast(
+                        fqme,
+                        status,
                     )
 
-                else:  # alert
-                    tickfilter = ('trade', 'utrade', 'last')
-                    percent_away = 0
-                    abs_diff_away = 0
-
-                # submit execution/order to EMS scan loop
-                # NOTE: this may result in an override of an existing
-                # dark book entry if the order id already exists
-                dark_book.triggers.setdefault(
-                    fqme, {}
-                )[oid] = (
-                    pred,
-                    tickfilter,
-                    req,
-                    percent_away,
-                    abs_diff_away
-                )
-                resp = 'dark_open'
-
-                # alerts have special msgs to distinguish
-                # if action == 'alert':
-                #     resp = 'open'
-
-                status = Status(
-                    resp=resp,
-                    oid=oid,
-                    time_ns=time.time_ns(),
-                    req=req,
-                    src='dark',
-                )
-                dark_book._active[oid] = status
-
-                # broadcast status to all subscribed clients
-                await router.client_broadcast(
-                    fqme,
-                    status,
-                )
-
-            case _:
-                log.warning(f'Rx UNHANDLED order request {cmd}')
+                case _:
+                    log.warning(f'Rx UNHANDLED order request {cmd}')
 
 
 @acm
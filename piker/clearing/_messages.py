@@ -114,6 +114,21 @@ class Cancel(Struct):
     action: str = 'cancel'
 
 
+class Batch(Struct):
+    '''
+    A sequence of ``Order``/``Cancel`` cmds packed into a single msg
+    (and thus a single IPC frame) for "burst" submissions, eg. cancel-all.
+
+    The ``emsd`` processes each cmd in order exactly as if it were sent
+    on its own; there are no all-or-none semantics, a cmd which is
+    rejected (or unhandled) does not prevent processing the remainder
+    and each results in its own ``Status`` response(s).
+
+    '''
+    cmds: list[dict]
+    action: str = 'batch'
+
+
 # --------------
 # Client <- emsd
 # --------------
@@ -31,10 +31,7 @@ from pathlib import Path
 
 from bidict import bidict
 import tomlkit
-try:
-    import tomllib
-except ModuleNotFoundError:
-    import tomli as tomllib
+import tomllib
 
 
 from .log import get_logger
@@ -4,8 +4,8 @@ Mock a broker module.
 from itertools import cycle
 import json
 from os import path
+from contextlib import asynccontextmanager
 import trio
-from async_generator import asynccontextmanager
 from ..brokers import questrade
 from ..calc import percent_change
 
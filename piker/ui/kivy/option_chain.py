@@ -5,9 +5,9 @@ Launch with ``piker options <symbol>``.
 import types
 from functools import partial
 from typing import Dict, List
+from contextlib import asynccontextmanager
 
 import trio
-from async_generator import asynccontextmanager
 import tractor
 from kivy.uix.boxlayout import BoxLayout
 from kivy.lang import Builder
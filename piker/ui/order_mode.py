@@ -431,7 +431,7 @@ class OrderMode:
             # TODO: some kind of mini-perms system here based on
             # an out-of-band tagging/auth sub-sys for multiplayer
             # order control?
-            self.client._sent_orders[order.oid] = order
+            self.client._track(order)
 
         return dialog
 
@@ -628,21 +628,23 @@ class OrderMode:
                 group_key=True
             )
 
-            # cancel all active orders and triggers
-            for line in lines:
-                dialog = getattr(line, 'dialog', None)
+            # cancel all active orders and triggers, delivered to
+            # the ems in a single batch msg.
+            with self.client.batched():
+                for line in lines:
+                    dialog = getattr(line, 'dialog', None)
 
-                if dialog:
-                    oid = dialog.uuid
+                    if dialog:
+                        oid = dialog.uuid
 
-                    cancel_status_close = self.multistatus.open_status(
-                        f'cancelling order {oid}',
-                        group_key=key,
-                    )
-                    dialog.last_status_close = cancel_status_close
+                        cancel_status_close = self.multistatus.open_status(
+                            f'cancelling order {oid}',
+                            group_key=key,
+                        )
+                        dialog.last_status_close = cancel_status_close
 
-                    ids.append(oid)
-                    self.client.cancel_nowait(uuid=oid)
+                        ids.append(oid)
+                        self.client.cancel_nowait(uuid=oid)
 
         return ids
 
@@ -1123,6 +1125,9 @@ async def process_trade_msg(
                 await notify_from_ems_status_msg(msg)
             mode.lines.remove_line(uuid=oid)
 
+            # dialog is complete, stop tracking the order
+            client._sent_orders.pop(oid, None)
+
         # each clearing tick is responded individually
         case Status(resp='fill'):
 
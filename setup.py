@@ -45,13 +45,14 @@ setup(
     },
     install_requires=[
         # 'tomlkit',  # fork & fix for now..
-        'tomli',  # for pre-3.11
         'tomli-w',  # for fast ledger writing
         'colorlog',
         'attrs',
         'pygments',
         'colorama',  # numba traceback coloring
-        'msgspec',  # performant IPC messaging and structs
+        # performant IPC messaging and structs; NOTE: ships only
+        # a C-ext (no slow pure-py fallback) so no build flags needed.
+        'msgspec',
         'protobuf',
         'typer',
         'rich',
@@ -60,7 +61,6 @@ setup(
         'trio',
         'trio-websocket',
         'trio-util',
-        'async_generator',
 
         # from github currently (see requirements.txt)
         # normally pinned to particular git hashes..
@@ -95,7 +95,7 @@ setup(
         ]
     },
     tests_require=['pytest'],
-    python_requires=">=3.10",
+    python_requires=">=3.11",
     keywords=[
         "async",
         "trading",
@@ -109,8 +109,8 @@ setup(
         'Operating System :: POSIX :: Linux',
         "Programming Language :: Python :: Implementation :: CPython",
         "Programming Language :: Python :: 3 :: Only",
-        "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
         'Intended Audience :: Financial and Insurance Industry',
         'Intended Audience :: Science/Research',
         'Intended Audience :: Developers',
@@ -0,0 +1,91 @@
+'''
+Broker high level (``piker.brokers.core``) api tests using a fake
+(offline) backend.
+
+'''
+from contextlib import asynccontextmanager as acm
+from types import ModuleType
+
+import trio
+from trio.testing import MockClock
+
+from piker.brokers import core
+
+
+class FakeClient:
+    '''
+    Quote client which records each request's symbols and completes
+    later chunks *first* to verify result ordering.
+
+    '''
+    max_batch: int = 2
+    rate_limit: int = 2
+
+    def __init__(self):
+        self.reqs: list[list[str]] = []
+
+    async def quote(self, tickers: list[str]) -> list[dict]:
+        self.reqs.append(list(tickers))
+        await trio.sleep(0.1 / len(self.reqs))
+        return [{'symbol': sym} for sym in tickers]
+
+
+def mk_brokermod(client: FakeClient) -> ModuleType:
+    mod = ModuleType('fakebroker')
+
+    @acm
+    async def get_client():
+        yield client
+
+    mod.get_client = get_client
+    return mod
+
+
+def run_stocks_quote(
+    tickers: list[str],
+) -> tuple[list[dict], FakeClient, float]:
+
+    client = FakeClient()
+
+    async def main():
+        start = trio.current_time()
+        quotes = await core.stocks_quote(mk_brokermod(client), tickers)
+        return quotes, trio.current_time() - start
+
+    quotes, elapsed = trio.run(
+        main,
+        clock=MockClock(autojump_threshold=0),
+    )
+    return quotes, client, elapsed
+
+
+def test_stocks_quote_single_request():
+    tickers = ['AAPL', 'TSLA']
+    quotes, client, _ = run_stocks_quote(tickers)
+    assert client.reqs == [tickers]
+    assert [q['symbol'] for q in quotes] == tickers
+
+
+def test_stocks_quote_chunked_in_order():
+    tickers = ['AAPL', 'TSLA', 'CGC', 'CRON', 'WEED']
+    quotes, client, elapsed = run_stocks_quote(tickers)
+
+    # ``max_batch``-sized chunks
+    assert sorted(client.reqs) == sorted([
+        ['AAPL', 'TSLA'],
+        ['CGC', 'CRON'],
+        ['WEED'],
+    ])
+    # merged in input order
+    assert [q['symbol'] for q in quotes] == tickers
+
+    # 3 chunks at 2/sec means waiting out one second
+    assert 1 <= elapsed < 2
+
+
+def test_stocks_quote_no_rate_wait_for_single_wave():
+    tickers = ['AAPL', 'TSLA', 'CGC', 'CRON']
+    quotes, client, elapsed = run_stocks_quote(tickers)
+    assert len(client.reqs) == 2
+    assert [q['symbol'] for q in quotes] == tickers
+    assert elapsed < 1
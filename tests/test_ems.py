@@ -388,6 +388,103 @@ def test_multi_fill_positions(
         run_and_tollerate_cancels(just_check_pp)
 
 
+async def wait_for_status(
+    trades_stream: tractor.MsgStream,
+    oids: set[str],
+    resp: str,
+
+) -> list[Status]:
+    '''
+    Wait for a ``Status(resp=resp)`` msg for every order in ``oids``.
+
+    '''
+    pending: set[str] = set(oids)
+    msgs: list[Status] = []
+    async for msg in trades_stream:
+        match msg:
+            case {'name': 'status', 'oid': oid} if (
+                msg['resp'] == resp
+                and oid in pending
+            ):
+                msgs.append(Status(**msg))
+                pending.remove(oid)
+
+        if not pending:
+            return msgs
+
+
+def test_batched_submit_and_cancel_all(
+    open_test_pikerd: AsyncContextManager,
+    loglevel: str,
+):
+    '''
+    Submit multiple dark orders in a single ``Batch`` msg then cancel
+    them all from a ``OrderClient.batched()`` block (like the UI's
+    cancel-all) and verify every cmd gets its own status response.
+
+    '''
+    broker: str = 'kraken'
+    fqme: str = f'xbtusdt.{broker}'
+
+    async def atest():
+        async with (
+            open_test_pikerd() as (_, _, _, _),
+            open_ems(
+                fqme,
+                mode='paper',
+                loglevel=loglevel,
+            ) as (
+                client,  # OrderClient
+                trades_stream,  # tractor.MsgStream
+                _,  # startup_pps
+                _,  # accounts
+                _,  # dialogs
+            ),
+        ):
+            # dark buys way below the market which will never clear
+            orders: list[Order] = [
+                Order(
+                    exec_mode='dark',
+                    action='buy',
+                    oid=str(uuid4()),
+                    account='paper',
+                    size=0.001,
+                    symbol=fqme,
+                    price=price,
+                    brokers=[broker],
+                )
+                for price in (1, 2, 3)
+            ]
+            oids: set[str] = {order.oid for order in orders}
+
+            with trio.fail_after(30):
+                await client.send_batch(orders)
+                opened = await wait_for_status(
+                    trades_stream,
+                    oids,
+                    'dark_open',
+                )
+                assert {msg.oid for msg in opened} == oids
+
+                # sync cancel-all relayed as a single batch msg
+                with client.batched() as batch:
+                    for oid in oids:
+                        client.cancel_nowait(uuid=oid)
+
+                    # nothing relayed until the block exits
+                    assert len(batch) == len(oids)
+                    assert client.relay_backlog() == 0
+
+                canceled = await wait_for_status(
+                    trades_stream,
+                    oids,
+                    'canceled',
+                )
+                assert {msg.oid for msg in canceled} == oids
+
+    run_and_tollerate_cancels(atest)
+
+
 # TODO: still need to implement offline storage of darks/alerts/paper
 # lives probably all the same way.. see
 # https://github.com/pikers/piker/issues/463
@@ -404,3 +501,156 @@ def test_open_orders_reloaded(
 
 def test_dark_order_clearing():
     ...
+
+
+def mk_local_client(
+    buffer_size: int = 16,
+) -> OrderClient:
+    '''
+    Build an ``OrderClient`` with only its local (sync) relay channel
+    set, no `emsd` connection required.
+
+    '''
+    tx, rx = trio.open_memory_channel(buffer_size)
+    return OrderClient(
+        _ems_stream=None,
+        _to_relay_task=tx,
+        _from_sync_order_client=rx,
+    )
+
+
+def mk_dark_order(
+    price: float = 1,
+    fqme: str = 'xbtusdt.kraken',
+) -> Order:
+    return Order(
+        exec_mode='dark',
+        action='buy',
+        oid=str(uuid4()),
+        account='paper',
+        size=0.001,
+        symbol=fqme,
+        price=price,
+        brokers=['kraken'],
+    )
+
+
+def test_sent_orders_lru_eviction(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    '''
+    The order history table is capped and evicts the least recently
+    sent/updated order; cancelling an evicted order is a no-op.
+
+    '''
+    from piker.clearing import _client
+    monkeypatch.setattr(_client, '_max_sent_orders', 2)
+
+    client = mk_local_client()
+    first, second, third = (mk_dark_order(price) for price in (1, 2, 3))
+
+    client.send_nowait(first)
+    client.send_nowait(second)
+
+    # updating the first moves it to most-recently-used
+    client.update_nowait(first.oid, price=1.5)
+    client.send_nowait(third)
+
+    assert list(client._sent_orders) == [first.oid, third.oid]
+    assert client._sent_orders[first.oid].price == 1.5
+
+    # cancel for the evicted order is dropped, not relayed
+    backlog: int = client.relay_backlog()
+    client.cancel_nowait(uuid=second.oid)
+    assert client.relay_backlog() == backlog
+
+
+def test_iter_orders():
+    '''
+    All tracked orders are iterated in send order, optionally
+    filtered to a single fqme.
+
+    '''
+    client = mk_local_client()
+    xbt, eth, xbt2 = (
+        mk_dark_order(fqme=fqme)
+        for fqme in (
+            'xbtusdt.kraken',
+            'ethusdt.kraken',
+            'xbtusdt.kraken',
+        )
+    )
+    for order in (xbt, eth, xbt2):
+        client.send_nowait(order)
+
+    assert list(client.iter_orders()) == [xbt, eth, xbt2]
+    assert list(client.iter_orders('xbtusdt.kraken')) == [xbt, xbt2]
+    assert list(client.iter_orders('ethusdt.kraken')) == [eth]
+    assert not list(client.iter_orders('nope.kraken'))
+
+
+def test_relay_backlog_warns_once(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    '''
+    The relay buffer backpressure warning is emitted only once per
+    episode of the buffer being >80% full and re-arms once drained;
+    ``.relay_backlog()`` tracks the number of queued msgs.
+
+    '''
+    from piker.clearing import _client
+    warnings: list[str] = []
+    monkeypatch.setattr(_client.log, 'warning', warnings.append)
+
+    client = mk_local_client(buffer_size=5)
+    rx = client._from_sync_order_client
+
+    def fill():
+        for i in range(5):
+            client.send_nowait(mk_dark_order())
+            assert client.relay_backlog() == i + 1
+
+    fill()
+    assert len(warnings) == 1
+
+    for _ in range(5):
+        rx.receive_nowait()
+    assert client.relay_backlog() == 0
+
+    fill()
+    assert len(warnings) == 2
+
+
+def test_closed_status_untracks_order():
+    '''
+    A 'closed' status for an order dialog removes it from the
+    client's history table (and its line from the chart).
+
+    '''
+    from types import SimpleNamespace
+    from piker.ui.order_mode import process_trade_msg
+
+    client = mk_local_client()
+    order = mk_dark_order()
+    client.send_nowait(order)
+
+    removed: list[str] = []
+    mode = SimpleNamespace(
+        dialogs={},
+        lines=SimpleNamespace(
+            remove_line=lambda uuid: removed.append(uuid),
+        ),
+    )
+    # as decoded off the wire from the `emsd`
+    msg: dict = {
+        'name': 'status',
+        'time_ns': 0,
+        'oid': order.oid,
+        'resp': 'closed',
+        'req': order.to_dict(),
+    }
+
+    trio.run(process_trade_msg, mode, client, msg)
+
+    assert order.oid not in client._sent_orders
+    assert removed == [order.oid]
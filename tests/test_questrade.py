@@ -17,7 +17,7 @@ from piker.brokers.data import DataFeed
 log = piker.log.get_logger('tests')
 
 
-pytestmark = pytest.mark.skipif(
+requires_api_key = pytest.mark.skipif(
     True,
     reason="questrade tests can only be run locally with an API key",
 )
@@ -111,6 +111,58 @@ def match_packet(symbols, quotes, feed_type='stock'):
     assert not quotes
 
 
+@pytest.fixture(autouse=True)
+def tmp_ticker_ids(tmp_path, monkeypatch):
+    """Don't read or write the user's real ticker id cache; the broker
+    config (and thus API key) is still loaded from the normal dir.
+    """
+    path = tmp_path / 'questrade' / 'ticker_ids.json'
+    monkeypatch.setattr(qt, '_ticker_ids_path', lambda: path)
+    return path
+
+
+def test_ticker_ids_roundtrip(tmp_ticker_ids):
+    assert qt.load_ticker_ids() == {}
+
+    ids = {'TSLA': ('38526', time.time()), 'AAPL': ('8049', time.time())}
+    qt.write_ticker_ids(ids)
+    assert qt.load_ticker_ids() == ids
+
+    # only the cache file is left behind, no temp files
+    assert list(tmp_ticker_ids.parent.iterdir()) == [tmp_ticker_ids]
+
+
+def test_ticker_ids_expiry():
+    now = time.time()
+    qt.write_ticker_ids({
+        'TSLA': ('38526', now),
+        'AAPL': ('8049', now - qt._ticker_ids_ttl - 1),
+    })
+    assert qt.load_ticker_ids() == {'TSLA': ('38526', now)}
+
+
+@pytest.mark.parametrize(
+    'contents',
+    [
+        '{"TSLA": ',
+        '{"TSLA": "38526"}',
+        '["TSLA"]',
+    ],
+    ids=['truncated', 'old_format', 'not_a_map'],
+)
+def test_ticker_ids_corrupt_fallback(tmp_ticker_ids, contents):
+    tmp_ticker_ids.parent.mkdir(parents=True)
+    tmp_ticker_ids.write_text(contents)
+    assert qt.load_ticker_ids() == {}
+
+
+def test_ticker_ids_write_failure_cleanup(tmp_ticker_ids):
+    with pytest.raises(TypeError):
+        qt.write_ticker_ids({'TSLA': object()})
+
+    assert not list(tmp_ticker_ids.parent.iterdir())
+
+
 @pytest.fixture
 def us_symbols():
     return ['TSLA', 'AAPL', 'CGC', 'CRON']
@@ -126,6 +178,7 @@ def cse_symbols():
     return ['TRUL.CN', 'CWEB.CN', 'SNN.CN']
 
 
+@requires_api_key
 # @tractor_test
 async def test_concurrent_tokens_refresh(us_symbols, loglevel):
     """Verify that concurrent requests from mulitple tasks work alongside
@@ -173,6 +226,7 @@ async def test_concurrent_tokens_refresh(us_symbols, loglevel):
             n.cancel_scope.cancel()
 
 
+@requires_api_key
 @trio_test
 async def test_batched_stock_quote(us_symbols):
     """Use the client stock quote api and verify quote response format.
@@ -183,6 +237,7 @@ async def test_batched_stock_quote(us_symbols):
         match_packet(us_symbols, quotes)
 
 
+@requires_api_key
 @trio_test
 async def test_stock_quoter_context(us_symbols):
     """Test that a quoter "context" used by the data feed daemon.
@@ -193,6 +248,7 @@ async def test_stock_quoter_context(us_symbols):
         match_packet(us_symbols, quotes)
 
 
+@requires_api_key
 @trio_test
 async def test_option_contracts(tmx_symbols):
     """Verify we can retrieve contracts by expiry.
@@ -209,6 +265,7 @@ async def test_option_contracts(tmx_symbols):
                     timespec='microseconds') == contracts[key]['expiryDate']
 
 
+@requires_api_key
 @trio_test
 async def test_option_chain(tmx_symbols):
     """Verify we can retrieve all option chains for a list of symbols.
@@ -229,6 +286,7 @@ async def test_option_chain(tmx_symbols):
             assert not quote
 
 
+@requires_api_key
 @trio_test
 async def test_option_quote_latency(tmx_symbols):
     """Audit option quote latencies.
@@ -340,6 +398,7 @@ async def stream_stocks(feed, symbols):
         await stream.aclose()
 
 
+@requires_api_key
 @pytest.mark.parametrize(
     'stream_what',
     [